@@ -5,48 +5,154 @@ This bot provides slash commands to interact with GitHub repositories
 and receive real-time notifications about repository activity.
 """
 
+import aiohttp
 import discord
 from discord import app_commands
 from discord.ext import commands
 import logging
 import asyncio
-from typing import Optional
+import hashlib
+import json
+import time
+from typing import Optional, List, Dict, Any
+
+from dateutil.parser import isoparse
 
 from config import Config
-from utils import GitHubAPI, MessageFormatter
+from utils import GitHubAPI, WindowLimiter, BranchRecord, CommitRecord, PRRecord, RepoStatus
+from utils.formatters import (
+    build_review_request, format_branch_list, format_commit_list,
+    format_pr_detail, format_pr_list, format_repository_status
+)
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Stores a hash of the last command tree synced to Discord
+COMMAND_HASH_FILE = '.command_hash'
+
+# Longest time (in seconds) a webhook notification waits to be batched with others
+NOTIFICATION_FLUSH_INTERVAL = 2.0
+
 
 class GitHubBot(commands.Bot):
     """Custom Discord bot class for GitHub integration."""
 
     def __init__(self):
         """Initialize the bot with required intents and configuration."""
-        intents = discord.Intents.default()
-        intents.message_content = True
+        # Slash commands arrive as interactions, which need no intents, so only
+        # subscribe to guild events (used to look up the notification channel).
+        # Message events and message content would just be extra gateway traffic.
+        intents = discord.Intents.none()
         intents.guilds = True
-        intents.guild_messages = True
 
-        super().__init__(command_prefix='!', intents=intents)
+        # No prefix commands are used; when_mentioned avoids needing message content
+        super().__init__(command_prefix=commands.when_mentioned, intents=intents)
 
-        # Initialize GitHub API client
-        self.github = GitHubAPI(Config.GITHUB_TOKEN, Config.GITHUB_REPO)
-        self.notification_channel_id = int(Config.DISCORD_CHANNEL_ID)
+        # GitHub API client and its HTTP session are created in setup_hook,
+        # once the event loop is running
+        self.http_session: Optional[aiohttp.ClientSession] = None
+        self.github: Optional[GitHubAPI] = None
+        self.notification_channel_id = Config.DISCORD_CHANNEL_ID_INT
         self.notification_channel: Optional[discord.TextChannel] = None
+        self.notification_limiter: Optional[WindowLimiter] = None
+
+        # Webhook notifications waiting to be sent. The flush task sends them
+        # together, up to 10 embeds per message, so bursts of events (e.g. a
+        # series of pushes) turn into a few messages instead of one per event.
+        self._pending_embeds: List[discord.Embed] = []
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # Set by close() to stop the flush task once its current batch is sent
+        self._stop_flushing = False
+
+        # Presence shown on every (re)connect; it never changes, so build it once
+        self._activity = discord.Activity(type=discord.ActivityType.watching, name=Config.GITHUB_REPO)
+
+        # In-process cache for slash command results. Entries are loaded from the
+        # GitHub API on a miss and then kept current by webhook events, so most
+        # commands are answered without a GitHub round trip. "ts" maps each cache
+        # key to the time.monotonic() value it was loaded at, and "gen" counts
+        # the webhook changes to each key so a fetch that overlapped one isn't
+        # stored. "commits" maps a branch to (commits, limit they were fetched with).
+        self.cache = {"prs": {}, "branches": [], "commits": {}, "status": None, "ts": {}, "gen": {}}
 
     async def setup_hook(self):
         """Set up the bot before it starts running."""
         logger.info("Setting up bot...")
 
-        # Sync commands with Discord
+        # Share one HTTP session across all GitHub API calls. Every request goes
+        # to api.github.com, so cap the pool per host and cache DNS lookups to
+        # keep connections (and their TLS handshakes) reused across commands.
+        # The timeout stops a stalled GitHub request from leaving a command
+        # stuck on "thinking..." (commands defer, so Discord waits up to 15 minutes).
+        self.http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, limit_per_host=64, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+        self.github = GitHubAPI(Config.GITHUB_TOKEN, Config.GITHUB_REPO, self.http_session)
+
+        # Discord allows 5 messages per 5 seconds in a channel
+        self.notification_limiter = WindowLimiter(5, 5.0)
+        self._flush_event = asyncio.Event()
+        self._flush_task = asyncio.create_task(self._flush_notifications())
+
+        # Sync commands with Discord, skipping the slow global sync when the
+        # command definitions haven't changed since the last successful one
         try:
-            synced = await self.tree.sync()
-            logger.info(f"Synced {len(synced)} command(s)")
+            command_hash = self._command_tree_hash()
+            if command_hash == self._read_command_hash():
+                logger.info("Commands unchanged since last sync, skipping sync")
+            else:
+                synced = await self.tree.sync()
+                logger.info(f"Synced {len(synced)} command(s)")
+                with open(COMMAND_HASH_FILE, 'w') as f:
+                    f.write(command_hash)
         except Exception as e:
             logger.error(f"Failed to sync commands: {e}")
 
+    def _command_tree_hash(self) -> str:
+        """
+        Hash the definitions of all registered slash commands.
+
+        Returns:
+            Hex SHA-256 digest of the command tree for this application.
+        """
+        commands_data = [command.to_dict(self.tree) for command in self.tree.get_commands()]
+        # Include the application ID so switching bot tokens forces a sync
+        data = json.dumps([self.application_id, commands_data], sort_keys=True)
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _read_command_hash() -> Optional[str]:
+        """
+        Read the command tree hash stored by the last successful sync.
+
+        Returns:
+            The stored hash, or None if no sync has been recorded.
+        """
+        try:
+            with open(COMMAND_HASH_FILE) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    async def close(self):
+        """Send queued notifications, then close the Discord connection and the GitHub HTTP session."""
+        if self._flush_task:
+            # Don't cancel the task: a batch it is sending has already left
+            # _pending_embeds and would be lost. Wake it up and let it finish.
+            self._stop_flushing = True
+            self._flush_event.set()
+            await self._flush_task
+            self._flush_task = None
+            # Send whatever arrived since the last flush while still connected
+            await self._send_pending()
+
+        await super().close()
+        if self.http_session:
+            await self.http_session.close()
+
     async def on_ready(self):
         """Called when the bot is ready and connected to Discord."""
         logger.info(f"Bot logged in as {self.user} (ID: {self.user.id})")
@@ -59,12 +165,42 @@ class GitHubBot(commands.Bot):
             logger.warning(f"Could not find notification channel with ID: {self.notification_channel_id}")
 
         # Set bot status
-        await self.change_presence(
-            activity=discord.Activity(
-                type=discord.ActivityType.watching,
-                name=f"{Config.GITHUB_REPO}"
-            )
-        )
+        await self.change_presence(activity=self._activity)
+
+    def queue_notification(self, embed: discord.Embed):
+        """
+        Queue a notification to be sent with the next batch.
+
+        The batch is sent once 10 embeds are waiting or after at most
+        NOTIFICATION_FLUSH_INTERVAL seconds, whichever comes first.
+
+        Args:
+            embed: Discord embed to send
+        """
+        self._pending_embeds.append(embed)
+        if len(self._pending_embeds) >= 10 and self._flush_event:
+            self._flush_event.set()
+
+    async def _flush_notifications(self):
+        """Background task that sends queued notifications in batches."""
+        while not self._stop_flushing:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=NOTIFICATION_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            try:
+                await self._send_pending()
+            except Exception as e:
+                # Nothing awaits this task, so log here rather than letting it die
+                logger.error(f"Error sending queued notifications: {e}", exc_info=True)
+
+    async def _send_pending(self):
+        """Send every queued notification."""
+        if not self._pending_embeds:
+            return
+        embeds, self._pending_embeds = self._pending_embeds, []
+        await self.send_notifications(embeds)
 
     async def send_notification(self, embed: discord.Embed):
         """
@@ -73,14 +209,241 @@ class GitHubBot(commands.Bot):
         Args:
             embed: Discord embed to send
         """
-        if self.notification_channel:
+        await self.send_notifications([embed])
+
+    async def send_notifications(self, embeds: List[discord.Embed]):
+        """
+        Send several notifications to the configured notification channel.
+
+        Embeds are packed 10 to a message (Discord's per-message maximum). The
+        messages are sent one after another so events show up in the order
+        they happened; the channel's rate limit paces them either way.
+
+        Args:
+            embeds: Discord embeds to send
+        """
+        if not self.notification_channel:
+            logger.warning("Notification channel not set")
+            return
+
+        batches = [embeds[i:i + 10] for i in range(0, len(embeds), 10)]
+        failed = 0
+        for batch in batches:
             try:
-                await self.notification_channel.send(embed=embed)
-                logger.info("Notification sent successfully")
+                await self._send_embeds(batch)
             except Exception as e:
-                logger.error(f"Failed to send notification: {e}")
+                failed += 1
+                logger.error(f"Failed to send notification message: {e}")
+
+        if failed:
+            logger.error(f"Failed to send {failed} of {len(batches)} notification message(s)")
         else:
-            logger.warning("Notification channel not set")
+            logger.info(f"Sent {len(embeds)} notification(s) successfully")
+
+    async def _send_embeds(self, embeds: List[discord.Embed]):
+        """
+        Send up to 10 embeds as one message to the notification channel.
+
+        Args:
+            embeds: Discord embeds to send
+        """
+        await self.notification_limiter.acquire()
+        await self.notification_channel.send(embeds=embeds)
+
+    def is_cache_fresh(self, key: str) -> bool:
+        """
+        Check whether a cache entry was loaded within the last CACHE_TTL seconds.
+
+        Args:
+            key: Cache key (e.g. 'prs', 'branches', 'status', 'commits:main')
+
+        Returns:
+            bool: True if the entry can be served from cache, False otherwise.
+        """
+        loaded_at = self.cache["ts"].get(key)
+        return loaded_at is not None and time.monotonic() - loaded_at < Config.CACHE_TTL
+
+    def invalidate_cache(self, key: str):
+        """
+        Mark a cache entry as stale so the next command reloads it from GitHub.
+
+        Args:
+            key: Cache key to invalidate
+        """
+        self.cache["ts"].pop(key, None)
+        self._bump_generation(key)
+
+    def _bump_generation(self, key: str):
+        """
+        Record that a webhook event changed a cache entry.
+
+        Args:
+            key: Cache key that changed
+        """
+        self.cache["gen"][key] = self.cache["gen"].get(key, 0) + 1
+
+    def _can_store(self, key: str, generation: int) -> bool:
+        """
+        Check whether a fetch that started at a given generation may be cached.
+
+        A webhook event that arrived while the request was on the wire makes
+        its result older than the event, so it is returned but not stored.
+
+        Args:
+            key: Cache key being loaded
+            generation: Value of the key's generation when the fetch started
+
+        Returns:
+            bool: True if no webhook event changed the key during the fetch.
+        """
+        return self.cache["gen"].get(key, 0) == generation
+
+    async def get_open_pull_requests(self) -> Optional[List[PRRecord]]:
+        """
+        Get open pull requests from the cache, falling back to the GitHub API.
+
+        Returns:
+            List of open pull requests, newest first, or None if they could not be fetched.
+        """
+        if self.is_cache_fresh("prs"):
+            return list(self.cache["prs"].values())
+
+        generation = self.cache["gen"].get("prs", 0)
+        prs = await self.github.get_open_pull_requests()
+        # Only cache successful lookups (an empty list is a real result)
+        if prs is not None and self._can_store("prs", generation):
+            self.cache["prs"] = {pr.number: pr for pr in prs}
+            self.cache["ts"]["prs"] = time.monotonic()
+        return prs
+
+    async def get_commits(self, branch: str, limit: int = 10) -> Optional[List[CommitRecord]]:
+        """
+        Get recent commits on a branch from the cache, falling back to the GitHub API.
+
+        Args:
+            branch: Branch name
+            limit: Maximum number of commits to retrieve
+
+        Returns:
+            List of commits, newest first, or None if they could not be fetched.
+        """
+        key = f"commits:{branch}"
+        if self.is_cache_fresh(key):
+            commits, loaded_limit = self.cache["commits"][branch]
+            # A load with a larger limit covers this one, even if the branch
+            # had fewer commits than that
+            if limit <= loaded_limit:
+                return commits[:limit]
+
+        generation = self.cache["gen"].get(key, 0)
+        commits = await self.github.get_commits(branch=branch, limit=limit)
+        if commits is not None and self._can_store(key, generation):
+            self.cache["commits"][branch] = (commits, limit)
+            self.cache["ts"][key] = time.monotonic()
+        return commits
+
+    async def get_branches(self) -> Optional[List[BranchRecord]]:
+        """
+        Get repository branches from the cache, falling back to the GitHub API.
+
+        Returns:
+            List of branches, or None if they could not be fetched.
+        """
+        if self.is_cache_fresh("branches"):
+            return self.cache["branches"]
+
+        generation = self.cache["gen"].get("branches", 0)
+        branches = await self.github.get_branches()
+        if branches is not None and self._can_store("branches", generation):
+            self.cache["branches"] = branches
+            self.cache["ts"]["branches"] = time.monotonic()
+        return branches
+
+    async def get_repository_status(self) -> Optional[RepoStatus]:
+        """
+        Get the repository status summary from the cache, falling back to the GitHub API.
+
+        Returns:
+            Repository status summary, or None if it could not be fetched.
+        """
+        if self.is_cache_fresh("status"):
+            return self.cache["status"]
+
+        generation = self.cache["gen"].get("status", 0)
+        status = await self.github.get_repository_status()
+        if status and self._can_store("status", generation):
+            self.cache["status"] = status
+            self.cache["ts"]["status"] = time.monotonic()
+        return status
+
+    def apply_webhook_event(self, event_type: str, payload: Dict[str, Any]):
+        """
+        Update the command cache from an incoming GitHub webhook event.
+
+        Called by the webhook server, which runs on the bot's event loop.
+
+        Args:
+            event_type: Value of the X-GitHub-Event header
+            payload: GitHub webhook payload
+        """
+        # Every handled event can change one of the status counts
+        self.invalidate_cache("status")
+
+        if event_type == 'pull_request':
+            self._apply_pull_request_event(payload)
+
+        elif event_type == 'pull_request_review':
+            # Review states are part of the cached PR list
+            self.invalidate_cache("prs")
+
+        elif event_type == 'push':
+            ref = payload.get('ref', '')
+            if ref.startswith('refs/heads/'):
+                self.invalidate_cache(f"commits:{ref[len('refs/heads/'):]}")
+
+        elif event_type in ('create', 'delete') and payload.get('ref_type') == 'branch':
+            self._bump_generation("branches")
+            # Only patch a list that was fully loaded, otherwise wait for a reload
+            if self.is_cache_fresh("branches"):
+                name = payload['ref']
+                branches = [b for b in self.cache["branches"] if b.name != name]
+                if event_type == 'create':
+                    branches.append(BranchRecord(name=name, protected=False))
+                self.cache["branches"] = branches
+
+    def _apply_pull_request_event(self, payload: Dict[str, Any]):
+        """
+        Add or remove a pull request in the cached PR list.
+
+        Args:
+            payload: GitHub webhook payload for pull_request event
+        """
+        self._bump_generation("prs")
+        if not self.is_cache_fresh("prs"):
+            return
+
+        action = payload['action']
+        pr = payload['pull_request']
+
+        if action == 'opened':
+            # Newest first, matching the API's sort order
+            entry = PRRecord(
+                number=pr['number'],
+                title=pr['title'],
+                author=pr['user']['login'],
+                branch=f"{pr['head']['ref']} -> {pr['base']['ref']}",
+                url=pr['html_url'],
+                created_at=isoparse(pr['created_at']),
+                age="just now",
+                reviewers={},
+                state=pr['state']
+            )
+            self.cache["prs"] = {pr['number']: entry, **self.cache["prs"]}
+        elif action == 'closed':
+            self.cache["prs"].pop(pr['number'], None)
+        else:
+            # Edits, reopens, new pushes etc. - reload on next request
+            self.invalidate_cache("prs")
 
 
 # Initialize the bot
@@ -98,8 +461,14 @@ async def list_prs(interaction: discord.Interaction):
     await interaction.response.defer()
 
     try:
-        prs = bot.github.get_open_pull_requests()
-        embed = MessageFormatter.format_pr_list(prs)
+        prs = await bot.get_open_pull_requests()
+        if prs is None:
+            await interaction.followup.send(
+                "An error occurred while fetching pull requests. Please try again later.",
+                ephemeral=True
+            )
+            return
+        embed = format_pr_list(prs)
         await interaction.followup.send(embed=embed)
         logger.info(f"User {interaction.user} requested PR list")
     except Exception as e:
@@ -123,9 +492,9 @@ async def get_pr(interaction: discord.Interaction, number: int):
     await interaction.response.defer()
 
     try:
-        pr = bot.github.get_pull_request(number)
+        pr = await bot.github.get_pull_request(number)
         if pr:
-            embed = MessageFormatter.format_pr_detail(pr)
+            embed = format_pr_detail(pr)
             await interaction.followup.send(embed=embed)
             logger.info(f"User {interaction.user} requested PR #{number}")
         else:
@@ -154,9 +523,9 @@ async def get_commits(interaction: discord.Interaction, branch: str = "main"):
     await interaction.response.defer()
 
     try:
-        commits = bot.github.get_commits(branch=branch, limit=10)
+        commits = await bot.get_commits(branch=branch, limit=10)
         if commits:
-            embed = MessageFormatter.format_commit_list(commits, branch)
+            embed = format_commit_list(commits, branch)
             await interaction.followup.send(embed=embed)
             logger.info(f"User {interaction.user} requested commits for branch '{branch}'")
         else:
@@ -183,8 +552,14 @@ async def list_branches(interaction: discord.Interaction):
     await interaction.response.defer()
 
     try:
-        branches = bot.github.get_branches()
-        embed = MessageFormatter.format_branch_list(branches)
+        branches = await bot.get_branches()
+        if branches is None:
+            await interaction.followup.send(
+                "An error occurred while fetching branches. Please try again later.",
+                ephemeral=True
+            )
+            return
+        embed = format_branch_list(branches)
         await interaction.followup.send(embed=embed)
         logger.info(f"User {interaction.user} requested branch list")
     except Exception as e:
@@ -206,9 +581,9 @@ async def get_status(interaction: discord.Interaction):
     await interaction.response.defer()
 
     try:
-        status = bot.github.get_repository_status()
+        status = await bot.get_repository_status()
         if status:
-            embed = MessageFormatter.format_repository_status(status)
+            embed = format_repository_status(status)
             await interaction.followup.send(embed=embed)
             logger.info(f"User {interaction.user} requested repository status")
         else:
@@ -238,36 +613,25 @@ async def assign_reviewer(interaction: discord.Interaction, user: discord.Member
         user: Discord member to ping
         pr_number: Pull request number
     """
+    # Fetching the PR can take longer than Discord's 3 second response deadline
+    await interaction.response.defer()
+
     try:
         # Get PR information to include in the message
-        pr = bot.github.get_pull_request(pr_number)
+        pr = await bot.github.get_pull_request(pr_number)
 
         if pr:
-            embed = discord.Embed(
-                title=f"Review Request for PR #{pr_number}",
-                description=f"**{pr['title']}**\n\n{user.mention}, you've been requested to review this pull request.",
-                color=MessageFormatter.COLOR_ORANGE,
-                url=pr['url']
-            )
-            embed.add_field(name="Author", value=pr['author'], inline=True)
-            embed.add_field(name="Branch", value=f"`{pr['branch']}`", inline=True)
-            embed.add_field(
-                name="Changes",
-                value=f"+{pr['additions']} -{pr['deletions']} ({pr['files_changed']} files)",
-                inline=True
-            )
-            embed.set_footer(text=f"Requested by {interaction.user.display_name}")
-
-            await interaction.response.send_message(embed=embed)
+            embed = build_review_request(pr, user, interaction.user)
+            await interaction.followup.send(embed=embed)
             logger.info(f"User {interaction.user} requested review from {user} for PR #{pr_number}")
         else:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"Pull request #{pr_number} not found.",
                 ephemeral=True
             )
     except Exception as e:
         logger.error(f"Error in /assign command: {e}")
-        await interaction.response.send_message(
+        await interaction.followup.send(
             "An error occurred while processing your request. Please try again later.",
             ephemeral=True
         )
@@ -285,7 +649,21 @@ async def main():
         await bot.start(Config.DISCORD_BOT_TOKEN)
     except Exception as e:
         logger.error(f"Failed to start bot: {e}")
+    finally:
+        # bot.start() returns without closing the client, so send any queued
+        # notifications and close the connection and HTTP session here
+        if not bot.is_closed():
+            await bot.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        # uvloop is a faster drop-in event loop (not available on Windows)
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    if uvloop:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
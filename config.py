@@ -6,21 +6,63 @@ and provides them to the rest of the application.
 """
 
 import os
+import atexit
+import copy
+import functools
+import queue
 from dotenv import load_dotenv
 import logging
+import logging.handlers
 
 # Load environment variables from .env file
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('bot.log'),
-        logging.StreamHandler()
-    ]
-)
+# Configure logging. Log calls only put records on a queue; a background
+# listener thread does the actual file and console writes, so logging from
+# the event loop never blocks on disk I/O.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('bot.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves traceback formatting to the listener thread.
+
+    The stock prepare() formats the whole record, exception traceback
+    included, in the thread that logged it. Records stay in this process,
+    so exc_info can travel on the queue as is and the expensive frame walk
+    happens on the listener thread instead of the event loop.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge the message arguments but keep exc_info for the listener to format.
+
+        Args:
+            record: Record being logged
+
+        Returns:
+            logging.LogRecord: Copy of the record to put on the queue.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_log_queue = queue.SimpleQueue()
+_queue_handler = _DeferredQueueHandler(_log_queue)
+# force=True replaces any handlers installed before this module was imported,
+# keeping a single handler chain. discord.py only adds its own handler from
+# Client.run(); the entry points use bot.start(), which leaves logging alone.
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler], force=True)
+
+log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers)
+log_listener.start()
+# Flush queued records on shutdown
+atexit.register(log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
@@ -38,14 +80,30 @@ class Config:
     GITHUB_REPO = os.getenv('GITHUB_REPO')
     GITHUB_WEBHOOK_SECRET = os.getenv('GITHUB_WEBHOOK_SECRET')
 
-    # Flask Configuration
+    # Derived values, parsed once at import instead of on every use
+    GITHUB_OWNER, GITHUB_REPO_NAME = (
+        GITHUB_REPO.split('/', 1) if GITHUB_REPO and '/' in GITHUB_REPO else (None, None)
+    )
+    DISCORD_CHANNEL_ID_INT = (
+        int(DISCORD_CHANNEL_ID) if DISCORD_CHANNEL_ID and DISCORD_CHANNEL_ID.isdigit() else None
+    )
+
+    # Webhook Server Configuration
     FLASK_PORT = int(os.getenv('FLASK_PORT', 5000))
 
+    # Cache Configuration
+    # Seconds a cached slash-command result is served before refreshing from GitHub
+    CACHE_TTL = int(os.getenv('CACHE_TTL', 60))
+
     @classmethod
+    @functools.cache
     def validate(cls) -> bool:
         """
         Validate that all required environment variables are set.
 
+        The result is cached, so entry points can call this freely without
+        re-checking the environment or logging the outcome more than once.
+
         Returns:
             bool: True if all required variables are set, False otherwise.
         """
@@ -70,6 +128,11 @@ class Config:
             logger.error("GITHUB_REPO must be in format 'owner/repository'")
             return False
 
+        # Validate DISCORD_CHANNEL_ID format
+        if cls.DISCORD_CHANNEL_ID_INT is None:
+            logger.error("DISCORD_CHANNEL_ID must be a numeric Discord channel ID")
+            return False
+
         logger.info("Configuration validated successfully")
         return True
 
@@ -81,10 +144,4 @@ class Config:
         Returns:
             tuple[str, str]: A tuple of (owner, repo_name).
         """
-        parts = cls.GITHUB_REPO.split('/')
-        return parts[0], parts[1]
-
-
-# Validate configuration on module import
-if __name__ != '__main__':
-    Config.validate()
+        return cls.GITHUB_OWNER, cls.GITHUB_REPO_NAME
@@ -1,28 +1,28 @@
 """
 Main entry point for the GitHub-Discord Integration Bot.
 
-This script runs both the Discord bot and the Flask webhook server
-concurrently using threading.
+This script runs both the Discord bot and the webhook server
+concurrently on a single asyncio event loop.
 """
 
 import asyncio
-import threading
 import logging
 import signal
 import sys
 
+try:
+    # uvloop is a faster drop-in event loop (not available on Windows)
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from bot import bot
-from webhook_server import run_webhook_server
+from webhook_server import start_webhook_server
 from config import Config
 
 logger = logging.getLogger(__name__)
 
 
-def run_flask_in_thread():
-    """Run the Flask webhook server in a separate thread."""
-    run_webhook_server(bot)
-
-
 async def main():
     """Main function to run both bot and webhook server."""
     # Validate configuration
@@ -32,36 +32,43 @@ async def main():
 
     logger.info("Starting GitHub-Discord Integration Bot")
 
-    # Start Flask server in a separate thread
-    flask_thread = threading.Thread(target=run_flask_in_thread, daemon=True)
-    flask_thread.start()
-    logger.info("Webhook server thread started")
+    # Shut down gracefully on SIGINT/SIGTERM by cancelling this task, which
+    # runs the cleanup below. add_signal_handler isn't available on Windows,
+    # where Ctrl+C still cancels the task through asyncio.run().
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, main_task.cancel)
+        except NotImplementedError:
+            break
+
+    # Start the webhook server on this event loop, alongside the bot
+    webhook_runner = await start_webhook_server(bot)
+    logger.info("Webhook server started")
 
     # Start Discord bot
     try:
         await bot.start(Config.DISCORD_BOT_TOKEN)
-    except KeyboardInterrupt:
-        logger.info("Received keyboard interrupt, shutting down...")
-        await bot.close()
+    except asyncio.CancelledError:
+        logger.info("Received shutdown signal, shutting down...")
     except Exception as e:
         logger.error(f"Error running bot: {e}", exc_info=True)
-        await bot.close()
         sys.exit(1)
-
-
-def signal_handler(sig, frame):
-    """Handle shutdown signals gracefully."""
-    logger.info("Received shutdown signal, exiting...")
-    sys.exit(0)
+    finally:
+        # Stop accepting webhooks first, so no notification is queued after
+        # the bot has sent its last batch
+        await webhook_runner.cleanup()
+        if not bot.is_closed():
+            await bot.close()
 
 
 if __name__ == "__main__":
-    # Register signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
-    # Run the main function
+    # Run the main function, on uvloop when it is installed
     try:
-        asyncio.run(main())
+        if uvloop:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("Bot shut down successfully")
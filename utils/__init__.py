@@ -4,5 +4,10 @@ Utility modules for the GitHub-Discord Integration Bot.
 
 from .github_api import GitHubAPI
 from .formatters import MessageFormatter
+from .models import PRRecord, PRDetail, CommitRecord, BranchRecord, RepoStatus
+from .ratelimit import AsyncLimiter, WindowLimiter
 
-__all__ = ['GitHubAPI', 'MessageFormatter']
+__all__ = [
+    'GitHubAPI', 'MessageFormatter', 'AsyncLimiter', 'WindowLimiter',
+    'PRRecord', 'PRDetail', 'CommitRecord', 'BranchRecord', 'RepoStatus'
+]
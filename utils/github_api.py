@@ -1,77 +1,329 @@
 """
 GitHub API helper functions for interacting with the GitHub API.
 
-This module provides a wrapper around PyGithub to simplify common operations
-like fetching pull requests, commits, branches, and issues.
+This module provides an async wrapper around the GitHub REST and GraphQL APIs
+to simplify common operations like fetching pull requests, commits, branches,
+and issues. All requests go through a shared aiohttp session so they never
+block the Discord event loop.
 """
 
-from github import Github, GithubException
-from datetime import datetime, timedelta
+import aiohttp
+import asyncio
+import orjson
+from dateutil.parser import isoparse
+from datetime import date, datetime, timedelta, timezone
+import functools
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from urllib.parse import urlencode
+
+from .models import BranchRecord, CommitRecord, PRDetail, PRRecord, RepoStatus
+from .ratelimit import AsyncLimiter
 
 logger = logging.getLogger(__name__)
 
+API_URL = 'https://api.github.com'
+GRAPHQL_URL = f'{API_URL}/graphql'
+
+
+class GraphQLError(Exception):
+    """Raised when a GraphQL response contains errors."""
+
+
+# Exceptions raised for failed or timed out requests
+API_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, GraphQLError)
+
+# Open pull requests with their reviews, one page of 100 PRs per request
+OPEN_PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: OPEN, first: 100, after: $cursor, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        url
+        state
+        createdAt
+        headRefName
+        baseRefName
+        author { login }
+        reviews(first: 100) { nodes { state author { login } } }
+      }
+    }
+  }
+}
+"""
+
+# All counts shown by /status in a single request
+REPOSITORY_STATUS_QUERY = """
+query($owner: String!, $name: String!, $since: GitTimestamp!) {
+  repository(owner: $owner, name: $name) {
+    nameWithOwner
+    defaultBranchRef {
+      name
+      target { ... on Commit { history(since: $since) { totalCount } } }
+    }
+    pullRequests(states: OPEN) { totalCount }
+    issues(states: OPEN) { totalCount }
+    refs(refPrefix: "refs/heads/") { totalCount }
+  }
+}
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _midnight_for(day: date) -> str:
+    """
+    Get the GitHub timestamp for the start of a day.
+
+    Status polls on the same day reuse the cached value; the cache entry is
+    replaced when the date rolls over.
+
+    Args:
+        day: Calendar date
+
+    Returns:
+        Timestamp string for midnight of that day.
+    """
+    return datetime(day.year, day.month, day.day).strftime('%Y-%m-%dT%H:%M:%SZ')
+
 
 class GitHubAPI:
     """Wrapper class for GitHub API interactions."""
 
-    def __init__(self, token: str, repo_name: str):
+    # Maximum number of cached responses (oldest entries are dropped first)
+    CACHE_SIZE = 256
+
+    def __init__(self, token: str, repo_name: str, session: aiohttp.ClientSession):
         """
         Initialize the GitHub API client.
 
         Args:
             token: GitHub personal access token
             repo_name: Repository name in format 'owner/repo'
+            session: Shared aiohttp session used for all requests
+        """
+        self.session = session
+        self.repo_name = repo_name
+        self.owner, self.name = repo_name.split('/', 1)
+        self.repo_url = f"{API_URL}/repos/{repo_name}"
+        self.headers = {
+            'Authorization': f'Bearer {token}',
+            'Accept': 'application/vnd.github+json'
+        }
+        self.limiter = AsyncLimiter()
+        # GraphQL has its own point budget, separate from the REST limit
+        self.graphql_limiter = AsyncLimiter()
+
+        # Response cache for GET requests: url -> (etag, data, links)
+        self._cache: Dict[str, Tuple[Optional[str], Any, Dict[str, Any]]] = {}
+        # Requests currently on the wire, so identical concurrent calls share one
+        self._inflight: Dict[str, asyncio.Task] = {}
+        logger.info("GitHub API initialized for repository: %s", repo_name)
+
+    async def _fetch(self, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Send a GET request and decode the JSON response.
+
+        Every request is sent to GitHub, so results are never stale. When a
+        cached response has an ETag the request carries If-None-Match, and a
+        304 Not Modified reply reuses the cached body (304s also don't count
+        against GitHub's rate limit). Callers asking for a URL that is already
+        being fetched wait for that request instead of sending their own.
+
+        Args:
+            url: Full request URL
+            params: Optional query string parameters
+
+        Returns:
+            Tuple of (decoded JSON, pagination links keyed by rel).
+
+        Raises:
+            aiohttp.ClientResponseError: If GitHub returns an error status.
+        """
+        key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request(key, url, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield the shared request so one caller's cancellation doesn't cancel it for everyone
+        return await asyncio.shield(task)
+
+    async def _request(self, key: str, url: str, params: Optional[Dict[str, Any]]) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Send a GET request to GitHub and store the response in the cache.
+
+        Args:
+            key: Cache key for the request
+            url: Full request URL
+            params: Optional query string parameters
+
+        Returns:
+            Tuple of (decoded JSON, pagination links keyed by rel).
+        """
+        cached = self._cache.get(key)
+        headers = self.headers
+        if cached and cached[0]:
+            headers = {**self.headers, 'If-None-Match': cached[0]}
+
+        await self.limiter.acquire()
+        async with self.session.get(url, params=params, headers=headers) as resp:
+            self.limiter.update(resp.headers)
+            if resp.status == 304:
+                data, links = cached[1], cached[2]
+            else:
+                resp.raise_for_status()
+                # orjson decodes large list responses several times faster than json
+                data = orjson.loads(await resp.read())
+                links = {rel: link['url'] for rel, link in resp.links.items()}
+            etag = resp.headers.get('ETag')
+
+        # Re-insert so the dict stays ordered from least to most recently stored
+        self._cache.pop(key, None)
+        self._cache[key] = (etag, data, links)
+        if len(self._cache) > self.CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+
+        return data, links
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Fetch a single repository endpoint.
+
+        Args:
+            path: Path relative to the repository URL (e.g. '/pulls/1')
+            params: Optional query string parameters
+
+        Returns:
+            Decoded JSON response.
+        """
+        data, _ = await self._fetch(self.repo_url + path, params)
+        return data
+
+    async def _get_all(self, path: str, params: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """
+        Fetch every page of a repository list endpoint.
+
+        Pages are requested 100 items at a time (GitHub's maximum) so large
+        lists take as few round trips as possible.
+
+        Args:
+            path: Path relative to the repository URL (e.g. '/branches')
+            params: Optional query string parameters
+
+        Returns:
+            Items from all pages combined into a single list.
+        """
+        first_page, links = await self._fetch(self.repo_url + path, {'per_page': 100, **(params or {})})
+        items = list(first_page)  # Copy so the cached page isn't modified
+        while 'next' in links:
+            page, links = await self._fetch(str(links['next']))
+            items.extend(page)
+        return items
+
+    async def _graphql(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a GraphQL query against the repository.
+
+        Args:
+            query: GraphQL query text
+            variables: Query variables (owner and name are added automatically)
+
+        Returns:
+            The 'repository' object of the response data.
+
+        Raises:
+            aiohttp.ClientResponseError: If GitHub returns an error status.
+            GraphQLError: If the response reports query errors.
+        """
+        body = orjson.dumps({
+            'query': query,
+            'variables': {'owner': self.owner, 'name': self.name, **variables}
+        })
+
+        await self.graphql_limiter.acquire()
+        async with self.session.post(
+            GRAPHQL_URL, data=body,
+            headers={**self.headers, 'Content-Type': 'application/json'}
+        ) as resp:
+            self.graphql_limiter.update(resp.headers)
+            resp.raise_for_status()
+            result = orjson.loads(await resp.read())
+
+        # GraphQL reports query errors with a 200 status
+        if result.get('errors'):
+            raise GraphQLError(result['errors'][0].get('message', 'Unknown GraphQL error'))
+        return result['data']['repository']
+
+    async def _get_reviewers(self, pr_number: int) -> Dict[str, str]:
         """
-        self.client = Github(token)
-        self.repo = self.client.get_repo(repo_name)
-        logger.info(f"GitHub API initialized for repository: {repo_name}")
+        Get the latest review state for each reviewer of a pull request.
 
-    def get_open_pull_requests(self) -> List[Dict[str, Any]]:
+        Args:
+            pr_number: Pull request number
+
+        Returns:
+            Dictionary mapping reviewer login to review state.
+        """
+        reviews = await self._get_all(f"/pulls/{pr_number}/reviews")
+        # Later reviews overwrite earlier ones, keeping each reviewer's latest state
+        return {(review['user'] or {}).get('login', 'ghost'): review['state'] for review in reviews}
+
+    async def get_open_pull_requests(self) -> Optional[List[PRRecord]]:
         """
         Get all open pull requests for the repository.
 
         Returns:
-            List of dictionaries containing PR information.
+            List of open pull requests, newest first, or None if it could not be fetched.
         """
         try:
-            pulls = self.repo.get_pulls(state='open', sort='created', direction='desc')
             pr_list = []
-
-            for pr in pulls:
-                # Get review information
-                reviews = pr.get_reviews()
-                reviewers = {}
-                for review in reviews:
-                    reviewer = review.user.login
-                    state = review.state
-                    reviewers[reviewer] = state
-
-                # Calculate age
-                age = datetime.now() - pr.created_at.replace(tzinfo=None)
-                age_str = self._format_timedelta(age)
-
-                pr_list.append({
-                    'number': pr.number,
-                    'title': pr.title,
-                    'author': pr.user.login,
-                    'branch': f"{pr.head.ref} -> {pr.base.ref}",
-                    'url': pr.html_url,
-                    'created_at': pr.created_at,
-                    'age': age_str,
-                    'reviewers': reviewers,
-                    'state': pr.state
-                })
-
-            logger.info(f"Retrieved {len(pr_list)} open pull requests")
+            cursor = None
+            # GitHub timestamps are UTC, so compare against an aware UTC time (one for the whole list)
+            now = datetime.now(timezone.utc)
+
+            while True:
+                repo = await self._graphql(OPEN_PULL_REQUESTS_QUERY, {'cursor': cursor})
+                pulls = repo['pullRequests']
+
+                for pr in pulls['nodes']:
+                    # Calculate age
+                    created_at = isoparse(pr['createdAt'])
+                    age_str = self._format_timedelta(now - created_at)
+
+                    # Later reviews overwrite earlier ones, keeping each reviewer's latest state
+                    reviewers = {
+                        (review['author'] or {}).get('login', 'ghost'): review['state']
+                        for review in pr['reviews']['nodes']
+                    }
+
+                    pr_list.append(PRRecord(
+                        number=pr['number'],
+                        title=pr['title'],
+                        author=(pr['author'] or {}).get('login', 'ghost'),  # Deleted accounts have no author
+                        branch=f"{pr['headRefName']} -> {pr['baseRefName']}",
+                        url=pr['url'],
+                        created_at=created_at,
+                        age=age_str,
+                        reviewers=reviewers,
+                        state=pr['state'].lower()
+                    ))
+
+                if not pulls['pageInfo']['hasNextPage']:
+                    break
+                cursor = pulls['pageInfo']['endCursor']
+
+            logger.info("Retrieved %d open pull requests", len(pr_list))
             return pr_list
 
-        except GithubException as e:
-            logger.error(f"Error fetching pull requests: {e}")
-            return []
+        except API_ERRORS as e:
+            logger.error("Error fetching pull requests: %s", e)
+            return None
 
-    def get_pull_request(self, pr_number: int) -> Optional[Dict[str, Any]]:
+    async def get_pull_request(self, pr_number: int) -> Optional[PRDetail]:
         """
         Get detailed information about a specific pull request.
 
@@ -79,54 +331,45 @@ class GitHubAPI:
             pr_number: Pull request number
 
         Returns:
-            Dictionary containing PR information, or None if not found.
+            Pull request details, or None if not found.
         """
         try:
-            pr = self.repo.get_pull(pr_number)
-
-            # Get review information
-            reviews = pr.get_reviews()
-            reviewers = {}
-            for review in reviews:
-                reviewer = review.user.login
-                state = review.state
-                reviewers[reviewer] = state
-
-            # Get file changes
-            files_changed = pr.changed_files
-            additions = pr.additions
-            deletions = pr.deletions
-
-            # Calculate age
-            age = datetime.now() - pr.created_at.replace(tzinfo=None)
-            age_str = self._format_timedelta(age)
-
-            pr_info = {
-                'number': pr.number,
-                'title': pr.title,
-                'author': pr.user.login,
-                'branch': f"{pr.head.ref} -> {pr.base.ref}",
-                'url': pr.html_url,
-                'state': pr.state,
-                'created_at': pr.created_at,
-                'age': age_str,
-                'reviewers': reviewers,
-                'files_changed': files_changed,
-                'additions': additions,
-                'deletions': deletions,
-                'body': pr.body or 'No description provided.',
-                'mergeable': pr.mergeable,
-                'merged': pr.merged
-            }
-
-            logger.info(f"Retrieved pull request #{pr_number}")
+            # Get the PR and its review information concurrently
+            pr, reviewers = await asyncio.gather(
+                self._get(f"/pulls/{pr_number}"),
+                self._get_reviewers(pr_number)
+            )
+
+            # Calculate age (GitHub timestamps are UTC)
+            created_at = isoparse(pr['created_at'])
+            age_str = self._format_timedelta(datetime.now(timezone.utc) - created_at)
+
+            pr_info = PRDetail(
+                number=pr['number'],
+                title=pr['title'],
+                author=pr['user']['login'],
+                branch=f"{pr['head']['ref']} -> {pr['base']['ref']}",
+                url=pr['html_url'],
+                state=pr['state'],
+                created_at=created_at,
+                age=age_str,
+                reviewers=reviewers,
+                files_changed=pr['changed_files'],
+                additions=pr['additions'],
+                deletions=pr['deletions'],
+                body=pr['body'] or 'No description provided.',
+                mergeable=pr['mergeable'],
+                merged=pr['merged']
+            )
+
+            logger.info("Retrieved pull request #%d", pr_number)
             return pr_info
 
-        except GithubException as e:
-            logger.error(f"Error fetching pull request #{pr_number}: {e}")
+        except API_ERRORS as e:
+            logger.error("Error fetching pull request #%d: %s", pr_number, e)
             return None
 
-    def get_commits(self, branch: str = 'main', limit: int = 10) -> List[Dict[str, Any]]:
+    async def get_commits(self, branch: str = 'main', limit: int = 10) -> Optional[List[CommitRecord]]:
         """
         Get recent commits for a specific branch.
 
@@ -135,93 +378,87 @@ class GitHubAPI:
             limit: Maximum number of commits to retrieve (default: 10)
 
         Returns:
-            List of dictionaries containing commit information.
+            List of commits, newest first, or None if they could not be fetched.
         """
         try:
-            commits = self.repo.get_commits(sha=branch)[:limit]
+            # Ask for just the commits that are shown (GitHub allows up to 100 per page)
+            commits = (await self._get('/commits', {'sha': branch, 'per_page': min(limit, 100)}))[:limit]
             commit_list = []
 
             for commit in commits:
-                commit_list.append({
-                    'sha': commit.sha[:7],
-                    'message': commit.commit.message.split('\n')[0],  # First line only
-                    'author': commit.commit.author.name,
-                    'date': commit.commit.author.date,
-                    'url': commit.html_url
-                })
-
-            logger.info(f"Retrieved {len(commit_list)} commits from branch '{branch}'")
+                # First line only
+                message = commit['commit']['message']
+                newline = message.find('\n')
+                commit_list.append(CommitRecord(
+                    sha=commit['sha'][:7],
+                    message=message if newline < 0 else message[:newline],
+                    author=commit['commit']['author']['name'],
+                    date=isoparse(commit['commit']['author']['date']),
+                    url=commit['html_url']
+                ))
+
+            logger.info("Retrieved %d commits from branch '%s'", len(commit_list), branch)
             return commit_list
 
-        except GithubException as e:
-            logger.error(f"Error fetching commits for branch '{branch}': {e}")
-            return []
+        except API_ERRORS as e:
+            logger.error("Error fetching commits for branch '%s': %s", branch, e)
+            return None
 
-    def get_branches(self) -> List[Dict[str, str]]:
+    async def get_branches(self) -> Optional[List[BranchRecord]]:
         """
         Get all branches in the repository.
 
         Returns:
-            List of dictionaries containing branch information.
+            List of branches, or None if they could not be fetched.
         """
         try:
-            branches = self.repo.get_branches()
+            branches = await self._get_all('/branches')
             branch_list = []
 
             for branch in branches:
-                branch_list.append({
-                    'name': branch.name,
-                    'protected': branch.protected
-                })
+                branch_list.append(BranchRecord(
+                    name=branch['name'],
+                    protected=branch['protected']
+                ))
 
-            logger.info(f"Retrieved {len(branch_list)} branches")
+            logger.info("Retrieved %d branches", len(branch_list))
             return branch_list
 
-        except GithubException as e:
-            logger.error(f"Error fetching branches: {e}")
-            return []
+        except API_ERRORS as e:
+            logger.error("Error fetching branches: %s", e)
+            return None
 
-    def get_repository_status(self) -> Dict[str, Any]:
+    async def get_repository_status(self) -> Optional[RepoStatus]:
         """
         Get overall repository status including commits, PRs, and issues.
 
         Returns:
-            Dictionary containing repository status information.
+            Repository status summary, or None if it could not be fetched.
         """
         try:
-            # Get today's commits
-            today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-            commits_today = 0
-            try:
-                recent_commits = self.repo.get_commits(since=today)
-                commits_today = recent_commits.totalCount
-            except:
-                commits_today = 0
-
-            # Get open PRs count
-            open_prs = self.repo.get_pulls(state='open').totalCount
-
-            # Get open issues count
-            open_issues = self.repo.get_issues(state='open').totalCount - open_prs  # Subtract PRs
-
-            # Get branch count
-            branches = self.repo.get_branches().totalCount
-
-            status = {
-                'repo_name': self.repo.full_name,
-                'commits_today': commits_today,
-                'open_prs': open_prs,
-                'open_issues': open_issues,
-                'branches': branches,
-                'default_branch': self.repo.default_branch
-            }
+            repo = await self._graphql(REPOSITORY_STATUS_QUERY, {
+                'since': _midnight_for(date.today())
+            })
+
+            # Empty repositories have no default branch or commit history
+            default_branch = repo['defaultBranchRef'] or {}
+            history = (default_branch.get('target') or {}).get('history') or {}
+
+            status = RepoStatus(
+                repo_name=repo['nameWithOwner'],
+                commits_today=history.get('totalCount', 0),
+                open_prs=repo['pullRequests']['totalCount'],
+                open_issues=repo['issues']['totalCount'],  # GraphQL issues exclude PRs
+                branches=repo['refs']['totalCount'],
+                default_branch=default_branch.get('name', 'N/A')
+            )
 
             logger.info("Retrieved repository status")
             return status
 
-        except GithubException as e:
-            logger.error(f"Error fetching repository status: {e}")
-            return {}
+        except API_ERRORS as e:
+            logger.error("Error fetching repository status: %s", e)
+            return None
 
     @staticmethod
     def _format_timedelta(td: timedelta) -> str:
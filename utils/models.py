@@ -0,0 +1,80 @@
+"""
+Data records returned by the GitHub API helper.
+
+The bot keeps these in its command cache and the formatters read them on
+every render, so each record declares __slots__: instances have no per-object
+__dict__ and field access is a fixed attribute lookup instead of a dict lookup.
+(dataclass(slots=True) would do this automatically but needs Python 3.10.)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+
+@dataclass
+class PRRecord:
+    """An open pull request, as listed by /prs."""
+
+    __slots__ = ('number', 'title', 'author', 'branch', 'url', 'created_at', 'age', 'reviewers', 'state')
+
+    number: int
+    title: str
+    author: str
+    branch: str  # 'head -> base'
+    url: str
+    created_at: datetime
+    age: str
+    reviewers: Dict[str, str]  # Reviewer login -> latest review state
+    state: str
+
+
+@dataclass
+class PRDetail(PRRecord):
+    """A single pull request with the extra details shown by /pr."""
+
+    __slots__ = ('files_changed', 'additions', 'deletions', 'body', 'mergeable', 'merged')
+
+    files_changed: int
+    additions: int
+    deletions: int
+    body: str
+    mergeable: Optional[bool]  # None while GitHub is still computing it
+    merged: bool
+
+
+@dataclass
+class CommitRecord:
+    """A commit on a branch, as listed by /commits."""
+
+    __slots__ = ('sha', 'message', 'author', 'date', 'url')
+
+    sha: str  # Short (7 character) SHA
+    message: str  # First line only
+    author: str
+    date: datetime
+    url: str
+
+
+@dataclass(frozen=True)
+class BranchRecord:
+    """A repository branch, as listed by /branches."""
+
+    __slots__ = ('name', 'protected')
+
+    name: str
+    protected: bool
+
+
+@dataclass(frozen=True)
+class RepoStatus:
+    """Repository activity summary shown by /status."""
+
+    __slots__ = ('repo_name', 'commits_today', 'open_prs', 'open_issues', 'branches', 'default_branch')
+
+    repo_name: str
+    commits_today: int
+    open_prs: int
+    open_issues: int
+    branches: int
+    default_branch: str
@@ -0,0 +1,101 @@
+"""
+Rate limiting helpers for the GitHub and Discord APIs.
+
+GitHub reports the remaining request budget in the X-RateLimit-Remaining and
+X-RateLimit-Reset headers of every response. AsyncLimiter tracks those values
+and makes callers wait for the reset once the budget runs low, instead of
+letting every command fail with 403 errors at once.
+
+WindowLimiter enforces a fixed "N calls per period" limit, such as Discord's
+limit of 5 messages per 5 seconds in a channel.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncLimiter:
+    """Header-driven limiter shared by all requests to one API."""
+
+    def __init__(self, min_remaining: int = 10):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            min_remaining: Wait for the reset when fewer requests than this are left
+        """
+        self.min_remaining = min_remaining
+        self.remaining: Optional[int] = None  # Unknown until the first response
+        self.reset_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """
+        Wait until a request may be sent without exhausting the budget.
+
+        The lock makes concurrent callers queue behind a single sleep rather
+        than each one sleeping and then firing at the same moment.
+        """
+        async with self._lock:
+            if self.remaining is not None and self.remaining < self.min_remaining:
+                delay = self.reset_at - time.time()
+                if delay > 0:
+                    logger.warning("GitHub rate limit nearly exhausted, waiting %.0fs for reset", delay)
+                    await asyncio.sleep(delay)
+                # The budget has reset; the next response reports the new value
+                self.remaining = None
+
+            if self.remaining is not None:
+                # Reserve a request so concurrent callers see the reduced budget
+                self.remaining -= 1
+
+    def update(self, headers: Mapping[str, str]):
+        """
+        Record the rate limit state reported by a GitHub response.
+
+        Args:
+            headers: Response headers
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+
+        self.remaining = int(remaining)
+        self.reset_at = float(reset)
+
+
+class WindowLimiter:
+    """Sliding window limiter allowing max_rate calls per period seconds."""
+
+    def __init__(self, max_rate: int, period: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            max_rate: Maximum number of calls allowed within one period
+            period: Length of the window in seconds
+        """
+        self.max_rate = max_rate
+        self.period = period
+        self._calls: Deque[float] = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until another call fits in the current window."""
+        async with self._lock:
+            now = time.monotonic()
+            # Forget calls that have left the window
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+
+            if len(self._calls) >= self.max_rate:
+                await asyncio.sleep(self.period - (now - self._calls[0]))
+                self._calls.popleft()
+
+            self._calls.append(time.monotonic())
@@ -1,35 +1,135 @@
 """
-Flask webhook server for receiving GitHub webhook events.
+Webhook server for receiving GitHub webhook events.
 
-This server receives webhook events from GitHub, validates them,
-and sends formatted notifications to Discord via the bot.
+This aiohttp server receives webhook events from GitHub, validates them,
+and sends formatted notifications to Discord via the bot. It runs on the
+same event loop as the Discord bot, so handlers can await the bot directly.
 """
 
-from flask import Flask, request, jsonify
+from aiohttp import web
+from collections import OrderedDict
 import hmac
-import hashlib
 import logging
-import asyncio
 import discord
+import orjson
+from typing import Optional, Tuple
 
 from config import Config
-from utils import MessageFormatter
+from utils.formatters import (
+    format_branch_notification, format_commit_notification, format_issue_notification,
+    format_pull_request_notification, format_review_notification
+)
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+routes = web.RouteTableDef()
 
 # Store reference to Discord bot (will be set when server starts)
 discord_bot = None
 
+# Webhook secret as bytes, encoded once rather than on every request
+# (None if unset, in which case every signature is rejected)
+_SECRET_BYTES = Config.GITHUB_WEBHOOK_SECRET.encode('utf-8') if Config.GITHUB_WEBHOOK_SECRET else None
 
-def verify_signature(payload: bytes, signature: str) -> bool:
+# GitHub sends signature as "sha256=<64 hex characters>"
+_SIG_PREFIX = 'sha256='
+_SIG_LENGTH = len(_SIG_PREFIX) + 64
+
+# GitHub caps webhook payloads at 25 MB; bodies are hashed in chunks as they arrive
+_MAX_BODY_SIZE = 25 * 1024 * 1024
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Embeds built for recently processed webhooks, keyed by X-GitHub-Delivery
+# (None for deliveries that don't notify). A delivery redelivered from
+# GitHub's UI keeps its ID, so it is posted again without being re-parsed
+# and re-formatted.
+_EMBED_CACHE: OrderedDict[str, Optional[discord.Embed]] = OrderedDict()
+_EMBED_CACHE_SIZE = 512
+
+# Fixed JSON bodies for every webhook response, encoded once
+_OK_BODY = b'{"status": "success"}'
+_NO_EVENT_TYPE_BODY = b'{"error": "No event type"}'
+_INVALID_SIGNATURE_BODY = b'{"error": "Invalid signature"}'
+_NO_PAYLOAD_BODY = b'{"error": "No payload"}'
+_SERVER_ERROR_BODY = b'{"error": "Internal server error"}'
+_HEALTH_BODY = b'{"status": "ok", "message": "Webhook server is running"}'
+
+
+def _json_response(body: bytes, status: int = 200) -> web.Response:
+    """
+    Build a response around a pre-encoded JSON body.
+
+    aiohttp responses can't be sent twice, so a new one is made per request,
+    but the JSON body is never re-encoded.
+
+    Args:
+        body: Encoded JSON body
+        status: HTTP status code
+
+    Returns:
+        JSON response
+    """
+    return web.Response(body=body, status=status, content_type='application/json')
+
+
+def _cache_embed(delivery_id: Optional[str], embed: Optional[discord.Embed]):
+    """
+    Remember the embed built for a delivery, forgetting the oldest past the limit.
+
+    Args:
+        delivery_id: X-GitHub-Delivery header value (may be None)
+        embed: Embed built for the delivery, or None if it doesn't notify
+    """
+    if delivery_id is None:
+        return
+    _EMBED_CACHE[delivery_id] = embed
+    if len(_EMBED_CACHE) > _EMBED_CACHE_SIZE:
+        _EMBED_CACHE.popitem(last=False)
+
+
+# Actions that produce a notification
+_PR_ACTIONS = frozenset({'opened', 'closed', 'reopened'})
+_ISSUE_ACTIONS = frozenset({'opened', 'closed', 'reopened'})
+_BRANCH_REF_TYPES = frozenset({'branch'})  # Tags are ignored
+
+
+async def read_signed_body(request: web.Request) -> Tuple[bytearray, bytes]:
+    """
+    Read the request body, computing its HMAC as each chunk arrives.
+
+    Hashing while reading keeps a single copy of the body in memory and
+    overlaps the HMAC work with receiving the rest of the request.
+
+    Args:
+        request: Incoming HTTP request
+
+    Returns:
+        Tuple of (raw body, HMAC-SHA256 digest of the body).
+
+    Raises:
+        web.HTTPRequestEntityTooLarge: If the body is larger than GitHub ever sends.
+    """
+    if request.content_length is not None and request.content_length > _MAX_BODY_SIZE:
+        raise web.HTTPRequestEntityTooLarge(max_size=_MAX_BODY_SIZE, actual_size=request.content_length)
+
+    mac = hmac.new(_SECRET_BYTES or b'', digestmod='sha256')
+    body = bytearray()
+    async for chunk in request.content.iter_chunked(_READ_CHUNK_SIZE):
+        body += chunk
+        if len(body) > _MAX_BODY_SIZE:
+            raise web.HTTPRequestEntityTooLarge(max_size=_MAX_BODY_SIZE, actual_size=len(body))
+        mac.update(chunk)
+
+    return body, mac.digest()
+
+
+def verify_signature(digest: bytes, signature: str) -> bool:
     """
     Verify that the webhook payload came from GitHub.
 
     Args:
-        payload: Raw request body as bytes
+        digest: HMAC-SHA256 digest of the raw request body
         signature: X-Hub-Signature-256 header from GitHub
 
     Returns:
@@ -39,20 +139,23 @@ def verify_signature(payload: bytes, signature: str) -> bool:
         logger.warning("No signature provided in webhook request")
         return False
 
-    # GitHub sends signature as "sha256=<hash>"
-    if not signature.startswith('sha256='):
+    if len(signature) != _SIG_LENGTH or not signature.startswith(_SIG_PREFIX):
         logger.warning("Invalid signature format")
         return False
 
     # Extract the hash from the signature
-    received_hash = signature.split('=')[1]
+    try:
+        received_digest = bytes.fromhex(signature[len(_SIG_PREFIX):])
+    except ValueError:
+        logger.warning("Invalid signature format")
+        return False
 
-    # Compute expected hash
-    secret = Config.GITHUB_WEBHOOK_SECRET.encode('utf-8')
-    expected_hash = hmac.new(secret, payload, hashlib.sha256).hexdigest()
+    if _SECRET_BYTES is None:
+        logger.error("GITHUB_WEBHOOK_SECRET is not set; rejecting webhook")
+        return False
 
     # Compare hashes (use compare_digest to prevent timing attacks)
-    is_valid = hmac.compare_digest(expected_hash, received_hash)
+    is_valid = hmac.compare_digest(digest, received_digest)
 
     if not is_valid:
         logger.warning("Webhook signature validation failed")
@@ -60,74 +163,84 @@ def verify_signature(payload: bytes, signature: str) -> bool:
     return is_valid
 
 
-@app.route('/webhook', methods=['POST'])
-def handle_webhook():
+@routes.post('/webhook')
+async def handle_webhook(request: web.Request) -> web.Response:
     """
     Handle incoming GitHub webhook events.
 
+    Args:
+        request: Incoming HTTP request
+
     Returns:
         JSON response with status
     """
-    # Verify webhook signature
-    signature = request.headers.get('X-Hub-Signature-256')
-    if not verify_signature(request.data, signature):
-        logger.error("Webhook signature verification failed")
-        return jsonify({'error': 'Invalid signature'}), 401
-
     # Get event type
     event_type = request.headers.get('X-GitHub-Event')
     if not event_type:
         logger.error("No event type in webhook request")
-        return jsonify({'error': 'No event type'}), 400
+        return _json_response(_NO_EVENT_TYPE_BODY, status=400)
+
+    # Acknowledge events we never act on without reading or hashing the body
+    # (still 200 so GitHub doesn't report failed deliveries)
+    entry = _HANDLERS.get(event_type)
+    if entry is None:
+        logger.info("Unhandled event type: %s", event_type)
+        return _json_response(_OK_BODY)
+
+    # Verify webhook signature, hashing the body while it is read
+    body, digest = await read_signed_body(request)
+    signature = request.headers.get('X-Hub-Signature-256')
+    if not verify_signature(digest, signature):
+        logger.error("Webhook signature verification failed")
+        return _json_response(_INVALID_SIGNATURE_BODY, status=401)
+
+    # Checked after the signature so unsigned requests can't fill the cache.
+    # A redelivery is still posted: the first send may have failed (e.g. before
+    # the bot connected, or during a Discord outage).
+    delivery_id = request.headers.get('X-GitHub-Delivery')
+    if delivery_id in _EMBED_CACHE:
+        logger.info("Reusing notification built for delivery %s", delivery_id)
+        embed = _EMBED_CACHE[delivery_id]
+        if embed and discord_bot:
+            discord_bot.queue_notification(embed)
+        return _json_response(_OK_BODY)
 
-    # Get payload
-    payload = request.json
+    # Get payload, parsing the body that was already read for the signature check
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        payload = None
     if not payload:
         logger.error("No payload in webhook request")
-        return jsonify({'error': 'No payload'}), 400
+        return _json_response(_NO_PAYLOAD_BODY, status=400)
 
-    logger.info(f"Received {event_type} event from GitHub")
+    # Per-request detail; the handlers log what each event produced
+    logger.debug("Received %s event from GitHub", event_type)
 
     # Process the event
     try:
-        embed = None
-
-        if event_type == 'push':
-            embed = handle_push_event(payload)
+        # Keep the bot's slash command cache in sync with repository activity
+        if discord_bot:
+            discord_bot.apply_webhook_event(event_type, payload)
 
-        elif event_type == 'pull_request':
-            embed = handle_pull_request_event(payload)
+        # Drop actions we don't notify about before calling the handler
+        handler, key, allowed = entry
+        if allowed is not None and payload.get(key) not in allowed:
+            _cache_embed(delivery_id, None)
+            return _json_response(_OK_BODY)
 
-        elif event_type == 'pull_request_review':
-            embed = handle_review_event(payload)
+        embed = handler(payload)
 
-        elif event_type == 'pull_request_review_comment':
-            embed = handle_review_comment_event(payload)
-
-        elif event_type == 'issues':
-            embed = handle_issue_event(payload)
-
-        elif event_type == 'create':
-            embed = handle_create_event(payload)
-
-        elif event_type == 'delete':
-            embed = handle_delete_event(payload)
-
-        else:
-            logger.info(f"Unhandled event type: {event_type}")
-
-        # Send notification to Discord if we created an embed
+        # Queue notification for Discord if we created an embed
         if embed and discord_bot:
-            asyncio.run_coroutine_threadsafe(
-                discord_bot.send_notification(embed),
-                discord_bot.loop
-            )
+            discord_bot.queue_notification(embed)
 
-        return jsonify({'status': 'success'}), 200
+        _cache_embed(delivery_id, embed)
+        return _json_response(_OK_BODY)
 
     except Exception as e:
-        logger.error(f"Error processing webhook: {e}", exc_info=True)
-        return jsonify({'error': 'Internal server error'}), 500
+        logger.error("Error processing webhook: %s", e, exc_info=True)
+        return _json_response(_SERVER_ERROR_BODY, status=500)
 
 
 def handle_push_event(payload: dict) -> discord.Embed:
@@ -144,8 +257,8 @@ def handle_push_event(payload: dict) -> discord.Embed:
     if not payload.get('commits'):
         return None
 
-    embed = MessageFormatter.format_commit_notification(payload)
-    logger.info(f"Processed push event for {payload['ref']}")
+    embed = format_commit_notification(payload)
+    logger.info("Processed push event for %s", payload['ref'])
     return embed
 
 
@@ -161,18 +274,14 @@ def handle_pull_request_event(payload: dict) -> discord.Embed:
     """
     action = payload['action']
 
-    # Only process certain actions
-    if action not in ['opened', 'closed', 'reopened']:
-        return None
-
-    embed = MessageFormatter.format_pull_request_notification(payload)
-    logger.info(f"Processed pull_request event: {action}")
+    embed = format_pull_request_notification(payload)
+    logger.info("Processed pull_request event: %s", action)
     return embed
 
 
 def handle_review_event(payload: dict) -> discord.Embed:
     """
-    Handle pull request review events.
+    Handle submitted pull request reviews.
 
     Args:
         payload: GitHub webhook payload
@@ -180,20 +289,14 @@ def handle_review_event(payload: dict) -> discord.Embed:
     Returns:
         Discord embed for the event
     """
-    action = payload['action']
-
-    # Only process submitted reviews
-    if action != 'submitted':
-        return None
-
-    embed = MessageFormatter.format_review_notification(payload)
-    logger.info(f"Processed pull_request_review event")
+    embed = format_review_notification(payload)
+    logger.info("Processed pull_request_review event")
     return embed
 
 
 def handle_review_comment_event(payload: dict) -> discord.Embed:
     """
-    Handle pull request review comment events.
+    Handle newly created pull request review comments.
 
     Args:
         payload: GitHub webhook payload
@@ -201,12 +304,6 @@ def handle_review_comment_event(payload: dict) -> discord.Embed:
     Returns:
         Discord embed for the event
     """
-    action = payload['action']
-
-    # Only process created comments
-    if action != 'created':
-        return None
-
     # For now, we'll skip individual review comments to avoid spam
     # You can uncomment below to enable review comment notifications
     # comment = payload['comment']
@@ -214,7 +311,7 @@ def handle_review_comment_event(payload: dict) -> discord.Embed:
     # ...
     # return embed
 
-    logger.info(f"Skipped pull_request_review_comment event (to avoid spam)")
+    logger.info("Skipped pull_request_review_comment event (to avoid spam)")
     return None
 
 
@@ -230,18 +327,14 @@ def handle_issue_event(payload: dict) -> discord.Embed:
     """
     action = payload['action']
 
-    # Only process certain actions
-    if action not in ['opened', 'closed', 'reopened']:
-        return None
-
-    embed = MessageFormatter.format_issue_notification(payload)
-    logger.info(f"Processed issues event: {action}")
+    embed = format_issue_notification(payload)
+    logger.info("Processed issues event: %s", action)
     return embed
 
 
 def handle_create_event(payload: dict) -> discord.Embed:
     """
-    Handle create events (branch or tag created).
+    Handle create events for branches (tags are filtered out in _HANDLERS).
 
     Args:
         payload: GitHub webhook payload
@@ -249,20 +342,14 @@ def handle_create_event(payload: dict) -> discord.Embed:
     Returns:
         Discord embed for the event
     """
-    ref_type = payload.get('ref_type')
-
-    # Only process branch creation
-    if ref_type != 'branch':
-        return None
-
-    embed = MessageFormatter.format_branch_notification(payload, deleted=False)
-    logger.info(f"Processed create event: {ref_type}")
+    embed = format_branch_notification(payload, deleted=False)
+    logger.info("Processed create event: %s", payload['ref_type'])
     return embed
 
 
 def handle_delete_event(payload: dict) -> discord.Embed:
     """
-    Handle delete events (branch or tag deleted).
+    Handle delete events for branches (tags are filtered out in _HANDLERS).
 
     Args:
         payload: GitHub webhook payload
@@ -270,40 +357,64 @@ def handle_delete_event(payload: dict) -> discord.Embed:
     Returns:
         Discord embed for the event
     """
-    ref_type = payload.get('ref_type')
+    embed = format_branch_notification(payload, deleted=True)
+    logger.info("Processed delete event: %s", payload['ref_type'])
+    return embed
 
-    # Only process branch deletion
-    if ref_type != 'branch':
-        return None
 
-    embed = MessageFormatter.format_branch_notification(payload, deleted=True)
-    logger.info(f"Processed delete event: {ref_type}")
-    return embed
+# (handler, payload key, allowed values) for each X-GitHub-Event type. Events
+# whose payload[key] isn't allowed are acknowledged without calling the handler,
+# and event types missing from the table are ignored.
+_HANDLERS = {
+    'push': (handle_push_event, None, None),
+    'pull_request': (handle_pull_request_event, 'action', _PR_ACTIONS),
+    'pull_request_review': (handle_review_event, 'action', frozenset({'submitted'})),
+    'pull_request_review_comment': (handle_review_comment_event, 'action', frozenset({'created'})),
+    'issues': (handle_issue_event, 'action', _ISSUE_ACTIONS),
+    'create': (handle_create_event, 'ref_type', _BRANCH_REF_TYPES),
+    'delete': (handle_delete_event, 'ref_type', _BRANCH_REF_TYPES),
+}
 
 
-@app.route('/health', methods=['GET'])
-def health_check():
+@routes.get('/health')
+async def health_check(request: web.Request) -> web.Response:
     """
     Health check endpoint.
 
+    Args:
+        request: Incoming HTTP request
+
     Returns:
         JSON response indicating server is running
     """
-    return jsonify({'status': 'ok', 'message': 'Webhook server is running'}), 200
+    return _json_response(_HEALTH_BODY)
 
 
-def run_webhook_server(bot):
+app = web.Application()
+app.add_routes(routes)
+
+
+async def start_webhook_server(bot) -> web.AppRunner:
     """
-    Run the Flask webhook server.
+    Start the webhook server on the running event loop.
 
     Args:
         bot: Discord bot instance to send notifications through
+
+    Returns:
+        The server's runner; call its cleanup() method to stop the server.
     """
     global discord_bot
     discord_bot = bot
 
-    logger.info(f"Starting webhook server on port {Config.FLASK_PORT}")
-    app.run(host='0.0.0.0', port=Config.FLASK_PORT, debug=False)
+    logger.info("Starting webhook server on port %d", Config.FLASK_PORT)
+    # Skip the per-request access log line; handle_webhook logs each event itself
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    # A deep accept queue so bursts of deliveries wait instead of being refused
+    site = web.TCPSite(runner, '0.0.0.0', Config.FLASK_PORT, backlog=1024)
+    await site.start()
+    return runner
 
 
 if __name__ == '__main__':
@@ -314,4 +425,4 @@ if __name__ == '__main__':
 
     # Run server standalone (without bot)
     logger.warning("Running webhook server without Discord bot connection")
-    app.run(host='0.0.0.0', port=Config.FLASK_PORT, debug=True)
+    web.run_app(app, host='0.0.0.0', port=Config.FLASK_PORT, access_log=None, backlog=1024)